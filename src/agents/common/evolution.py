@@ -6,13 +6,17 @@ central location instead of defining it in each agent class.
 
 import logging
 from typing import Dict, Any, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 logger = logging.getLogger(__name__)
 
 class EvolutionMessagePayload(BaseModel):
     """Payload model for Evolution (WhatsApp) webhook messages."""
-    
+
+    # Webhook payloads are read-only once parsed; frozen instances are hashable
+    # and can be shared through the agent context without defensive copies.
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     instance: Optional[str] = None
     phoneNumber: Optional[str] = None
     remoteJid: Optional[str] = None
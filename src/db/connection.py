@@ -26,6 +26,18 @@ logger = logging.getLogger(__name__)
 # Connection pool for database connections
 _pool: Optional[ThreadedConnectionPool] = None
 
+# Options applied to every pooled connection. TCP keepalives stop idle pooled
+# connections from being silently dropped by NAT/firewalls between requests.
+_CONNECT_OPTIONS: Dict[str, Any] = {
+    "client_encoding": "UTF8",
+    "application_name": "automagik-agents",
+    "connect_timeout": 10,
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 5,
+}
+
 # Register UUID adapter for psycopg2
 psycopg2.extensions.register_adapter(uuid.UUID, lambda u: psycopg2.extensions.AsIs(f"'{u}'"))
 
@@ -188,16 +200,14 @@ def get_connection_pool() -> ThreadedConnectionPool:
                 # Can either connect with individual params or with a connection string
                 if settings.DATABASE_URL and attempt == 0:
                     try:
-                        # Add client_encoding to the connection string if not already present
-                        dsn = settings.DATABASE_URL
-                        if "client_encoding" not in dsn.lower():
-                            if "?" in dsn:
-                                dsn += "&client_encoding=UTF8"
-                            else:
-                                dsn += "?client_encoding=UTF8"
-
+                        # psycopg2 lets keyword options override the DSN, so only
+                        # pass the defaults the URL does not already set itself
+                        dsn_params = psycopg2.extensions.parse_dsn(settings.DATABASE_URL)
                         _pool = ThreadedConnectionPool(
-                            minconn=min_conn, maxconn=max_conn, dsn=dsn
+                            minconn=min_conn,
+                            maxconn=max_conn,
+                            dsn=settings.DATABASE_URL,
+                            **{k: v for k, v in _CONNECT_OPTIONS.items() if k not in dsn_params},
                         )
                         logger.info(
                             "Successfully connected to PostgreSQL using DATABASE_URL with UTF8 encoding"
@@ -223,7 +233,7 @@ def get_connection_pool() -> ThreadedConnectionPool:
                     user=config["user"],
                     password=config["password"],
                     database=config["database"],
-                    client_encoding="UTF8",  # Explicitly set client encoding
+                    **_CONNECT_OPTIONS,
                 )
                 # Make sure we set the encoding correctly
                 with _pool.getconn() as conn:
@@ -262,11 +272,9 @@ def get_db_connection() -> Generator:
     pool = get_connection_pool()
     conn = None
     try:
+        # Pooled connections are opened with their client_encoding already
+        # set (see _CONNECT_OPTIONS), so checkout needs no extra round-trip
         conn = pool.getconn()
-        # Ensure UTF-8 encoding for this connection
-        with conn.cursor() as cursor:
-            cursor.execute("SET client_encoding = 'UTF8';")
-            conn.commit()
         yield conn
     finally:
         if conn:
@@ -15,7 +15,8 @@ from src.db.repository.agent import (
     increment_agent_run_id,
     link_session_to_agent,
     register_agent,
-    update_agent_active_prompt_id
+    update_agent_active_prompt_id,
+    invalidate_agent_cache
 )
 
 # User repository functions
@@ -109,6 +110,7 @@ __all__ = [
     "link_session_to_agent",
     "register_agent",
     "update_agent_active_prompt_id",
+    "invalidate_agent_cache",
     
     # User functions
     "get_user",
@@ -3,7 +3,9 @@
 import uuid
 import json
 import logging
-from typing import List, Optional, Dict
+import threading
+from datetime import datetime, timedelta
+from typing import List, Optional, Dict, Tuple
 
 from src.db.connection import execute_query
 from src.db.models import Agent
@@ -12,6 +14,74 @@ from src.version import SERVICE_INFO
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Columns mapped onto the Agent model; keep in sync with src/db/models.py.
+# Agent.system_prompt is deliberately left out: migration 20250513_183300
+# drops that column, so selecting it fails on migrated databases.
+_AGENT_COLUMNS = (
+    "id, name, type, model, description, version, config, active, run_id, "
+    "active_default_prompt_id, created_at, updated_at"
+)
+
+# In-process cache for agent lookups. Agents are resolved on every request and
+# session bind but change rarely; writes in this process invalidate the cache
+# and the TTL bounds staleness from writes made by other processes.
+_AGENT_CACHE_TTL = timedelta(seconds=30)
+_agent_cache_lock = threading.Lock()
+_agent_cache_by_id: Dict[int, Tuple[Agent, datetime]] = {}
+_agent_cache_by_name: Dict[str, Tuple[Agent, datetime]] = {}
+_AGENT_CACHE_MAXSIZE = 1024
+# Bumped on every invalidation so a read that raced a write is not cached
+_agent_cache_generation = 0
+
+# Suffixes that make a new agent name a variation of an existing one
+_AGENT_NAME_SUFFIXES = ("agent", "-agent", "_agent")
+
+
+def invalidate_agent_cache() -> None:
+    """Drop all cached agent lookups.
+
+    Must be called after any write to the agents table.
+    """
+    global _agent_cache_generation
+    with _agent_cache_lock:
+        _agent_cache_generation += 1
+        _agent_cache_by_id.clear()
+        _agent_cache_by_name.clear()
+
+
+def _get_cached_agent(cache: Dict, key) -> Optional[Agent]:
+    """Return a copy of a cached agent, or None on a miss or expired entry."""
+    with _agent_cache_lock:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        agent, expires_at = entry
+        if datetime.now() >= expires_at:
+            cache.pop(key, None)
+            return None
+    # Callers mutate the returned agent (see register_agent), so never hand
+    # out the cached instance itself
+    return agent.model_copy(deep=True)
+
+
+def _cache_agent(agent: Agent, generation: int) -> None:
+    """Store an agent under both its ID and name.
+
+    ``generation`` is the value of ``_agent_cache_generation`` read before the
+    agent was fetched; if the cache was invalidated since, the row may predate
+    a write and is not stored.
+    """
+    entry = (agent.model_copy(deep=True), datetime.now() + _AGENT_CACHE_TTL)
+    with _agent_cache_lock:
+        if generation != _agent_cache_generation:
+            return
+        for cache, key in ((_agent_cache_by_id, agent.id), (_agent_cache_by_name, agent.name)):
+            cache.pop(key, None)
+            if len(cache) >= _AGENT_CACHE_MAXSIZE:
+                # Dicts keep insertion order, so this evicts the oldest entry
+                cache.pop(next(iter(cache)))
+            cache[key] = entry
+
 
 def get_agent(agent_id: int) -> Optional[Agent]:
     """Get an agent by ID.
@@ -22,12 +92,21 @@ def get_agent(agent_id: int) -> Optional[Agent]:
     Returns:
         Agent object if found, None otherwise
     """
+    cached = _get_cached_agent(_agent_cache_by_id, agent_id)
+    if cached:
+        return cached
+
+    generation = _agent_cache_generation
     try:
         result = execute_query(
-            "SELECT * FROM agents WHERE id = %s",
+            f"SELECT {_AGENT_COLUMNS} FROM agents WHERE id = %s",
             (agent_id,)
         )
-        return Agent.from_db_row(result[0]) if result else None
+        if not result:
+            return None
+        agent = Agent.from_db_row(result[0])
+        _cache_agent(agent, generation)
+        return agent
     except Exception as e:
         logger.error(f"Error getting agent {agent_id}: {str(e)}")
         return None
@@ -42,12 +121,21 @@ def get_agent_by_name(name: str) -> Optional[Agent]:
     Returns:
         Agent object if found, None otherwise
     """
+    cached = _get_cached_agent(_agent_cache_by_name, name)
+    if cached:
+        return cached
+
+    generation = _agent_cache_generation
     try:
         result = execute_query(
-            "SELECT * FROM agents WHERE name = %s",
+            f"SELECT {_AGENT_COLUMNS} FROM agents WHERE name = %s",
             (name,)
         )
-        return Agent.from_db_row(result[0]) if result else None
+        if not result:
+            return None
+        agent = Agent.from_db_row(result[0])
+        _cache_agent(agent, generation)
+        return agent
     except Exception as e:
         logger.error(f"Error getting agent by name {name}: {str(e)}")
         return None
@@ -65,11 +153,11 @@ def list_agents(active_only: bool = True) -> List[Agent]:
     try:
         if active_only:
             result = execute_query(
-                "SELECT * FROM agents WHERE active = TRUE ORDER BY name"
+                f"SELECT {_AGENT_COLUMNS} FROM agents WHERE active = TRUE ORDER BY name"
             )
         else:
             result = execute_query(
-                "SELECT * FROM agents ORDER BY name"
+                f"SELECT {_AGENT_COLUMNS} FROM agents ORDER BY name"
             )
         return [Agent.from_db_row(row) for row in result]
     except Exception as e:
@@ -125,6 +213,7 @@ def create_agent(agent: Agent) -> Optional[int]:
             )
         )
         
+        invalidate_agent_cache()
         agent_id = result[0]["id"] if result else None
         logger.info(f"Created agent {agent.name} with ID {agent_id}")
         return agent_id
@@ -179,6 +268,7 @@ def update_agent(agent: Agent) -> Optional[int]:
             ),
             fetch=False
         )
+        invalidate_agent_cache()
         
         logger.info(f"Updated agent {agent.name} with ID {agent.id}")
         return agent.id
@@ -202,6 +292,7 @@ def delete_agent(agent_id: int) -> bool:
             (agent_id,),
             fetch=False
         )
+        invalidate_agent_cache()
         logger.info(f"Deleted agent with ID {agent_id}")
         return True
     except Exception as e:
@@ -226,53 +317,31 @@ def register_agent(name: str, agent_type: str, model: str, description: Optional
         # Use the name as-is, no normalization
         agent_name = name
         
-        # Validate agent name - check if it's a variation of an existing agent
-        # Get all existing agents to check against
-        existing_agents = list_agents(active_only=False)
-        
-        # Check if this agent name is a variation of an existing agent
-        for existing in existing_agents:
-            # Check if the new name is the existing name with "agent" suffix
-            if agent_name.lower() == f"{existing.name.lower()}agent":
-                logger.warning(f"Blocked registration of '{agent_name}' - variation of existing agent '{existing.name}'")
-                # Return the existing agent's ID instead
-                return existing.id
-            
-            # Check if the new name is the existing name with "-agent" suffix  
-            if agent_name.lower() == f"{existing.name.lower()}-agent":
-                logger.warning(f"Blocked registration of '{agent_name}' - variation of existing agent '{existing.name}'")
-                # Return the existing agent's ID instead
-                return existing.id
-                
-            # Check if the new name is the existing name with "_agent" suffix
-            if agent_name.lower() == f"{existing.name.lower()}_agent":
-                logger.warning(f"Blocked registration of '{agent_name}' - variation of existing agent '{existing.name}'")
+        # Block names that are an existing agent's name plus an "agent",
+        # "-agent" or "_agent" suffix and return the existing agent instead
+        lowered = agent_name.lower()
+        base_names = [
+            lowered[:-len(suffix)]
+            for suffix in _AGENT_NAME_SUFFIXES
+            if lowered.endswith(suffix) and len(lowered) > len(suffix)
+        ]
+        if base_names:
+            variation = execute_query(
+                "SELECT id, name FROM agents WHERE LOWER(name) = ANY(%s) ORDER BY name LIMIT 1",
+                (base_names,)
+            )
+            if variation:
+                existing = variation[0]
+                logger.warning(f"Blocked registration of '{agent_name}' - variation of existing agent '{existing['name']}'")
                 # Return the existing agent's ID instead
-                return existing.id
-        
-        # Check for existing agent with the exact name
-        existing = get_agent_by_name(agent_name)
-        
-        if existing:
-            # Update existing agent
-            logger.info(f"Found existing agent with name {existing.name} (ID: {existing.id})")
-            
-            existing.type = agent_type
-            existing.model = model
-            existing.description = description or existing.description
-            if config:
-                existing.config = config
-                
-            # Use update_agent
-            return update_agent(existing)
-        
-        # Create new agent with the provided name
-        logger.info(f"Creating new agent with name: {agent_name}")
+                return existing["id"]
         
         # Serialize config to JSON if needed
         config_json = json.dumps(config) if config else None
         
-        # Insert new agent
+        # Insert the agent, or update type/model (and description/config when
+        # provided) if one with this name already exists. Relies on the
+        # agents_name_unique constraint created by `db init`.
         result = execute_query(
             """
             INSERT INTO agents (
@@ -281,21 +350,32 @@ def register_agent(name: str, agent_type: str, model: str, description: Optional
             ) VALUES (
                 %s, %s, %s, %s, %s, true, 
                 %s, 1, NOW(), NOW()
-            ) RETURNING id
+            )
+            ON CONFLICT (name) DO UPDATE SET
+                type = EXCLUDED.type,
+                model = EXCLUDED.model,
+                description = COALESCE(EXCLUDED.description, agents.description),
+                config = COALESCE(EXCLUDED.config, agents.config),
+                updated_at = NOW()
+            RETURNING id, (xmax = 0) AS inserted
             """,
             (
                 agent_name, 
                 agent_type, 
                 model, 
-                description,
+                description or None,
                 config_json, 
                 "1.0.0"  # Default version
             )
         )
+        invalidate_agent_cache()
         
         if result:
             agent_id = result[0]["id"]
-            logger.info(f"Registered agent {agent_name} with ID {agent_id}")
+            if result[0]["inserted"]:
+                logger.info(f"Registered agent {agent_name} with ID {agent_id}")
+            else:
+                logger.info(f"Updated agent {agent_name} with ID {agent_id}")
             return agent_id
         
         return None
@@ -319,6 +399,7 @@ def increment_agent_run_id(agent_id: int) -> bool:
             (agent_id,),
             fetch=False
         )
+        invalidate_agent_cache()
         logger.info(f"Incremented run_id for agent {agent_id}")
         return True
     except Exception as e:
@@ -355,43 +436,32 @@ def link_session_to_agent(session_id: uuid.UUID, agent_id: int) -> bool:
             logger.debug(f"Session {session_id} already associated with agent {agent_id}, skipping updates")
             return True
             
-        # Check if any messages in this session need updating
-        message_count = execute_query(
+        # Update messages and the session in a single round-trip; rows already
+        # carrying this agent_id are filtered out by the WHERE clauses
+        result = execute_query(
             """
-            SELECT COUNT(*) as count FROM messages 
-            WHERE session_id = %s AND (agent_id IS NULL OR agent_id != %s)
-            """,
-            (str(session_id), agent_id)
-        )
-        
-        needs_update = message_count and message_count[0]["count"] > 0
-        
-        if needs_update:
-            # Only update messages that don't already have the correct agent_id
-            execute_query(
-                """
+            WITH updated_messages AS (
                 UPDATE messages
                 SET agent_id = %s
                 WHERE session_id = %s AND (agent_id IS NULL OR agent_id != %s)
-                """,
-                (agent_id, str(session_id), agent_id),
-                fetch=False
+                RETURNING 1
+            ), updated_sessions AS (
+                UPDATE sessions
+                SET agent_id = %s, updated_at = NOW()
+                WHERE id = %s AND (agent_id IS NULL OR agent_id != %s)
+                RETURNING 1
             )
-            logger.debug(f"Updated {message_count[0]['count']} messages to associate with agent {agent_id}")
-        else:
-            logger.debug(f"No messages need updating for session {session_id}")
-        
-        # Update the sessions table with the agent_id
-        execute_query(
-            """
-            UPDATE sessions
-            SET agent_id = %s, updated_at = NOW()
-            WHERE id = %s AND (agent_id IS NULL OR agent_id != %s)
+            SELECT
+                (SELECT COUNT(*) FROM updated_messages) AS message_count,
+                (SELECT COUNT(*) FROM updated_sessions) AS session_count
             """,
-            (agent_id, str(session_id), agent_id),
-            fetch=False
+            (agent_id, str(session_id), agent_id, agent_id, str(session_id), agent_id)
         )
-        logger.debug(f"Updated sessions table with agent_id {agent_id} for session {session_id}")
+        if result:
+            logger.debug(
+                f"Updated {result[0]['message_count']} messages and "
+                f"{result[0]['session_count']} sessions to associate with agent {agent_id}"
+            )
         
         logger.info(f"Session {session_id} associated with agent {agent_id} in database")
         return True
@@ -421,6 +491,7 @@ def update_agent_active_prompt_id(agent_id: int, prompt_id: int) -> bool:
             (prompt_id, agent_id),
             fetch=False
         )
+        invalidate_agent_cache()
         logger.info(f"Updated agent {agent_id} with active_default_prompt_id {prompt_id}")
         return True
     except Exception as e:
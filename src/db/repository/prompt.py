@@ -5,6 +5,7 @@ from typing import List, Optional
 
 from src.db.connection import execute_query
 from src.db.models import Prompt, PromptCreate, PromptUpdate
+from src.db.repository.agent import invalidate_agent_cache
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -170,6 +171,7 @@ def create_prompt(prompt_data: PromptCreate) -> Optional[int]:
                 (prompt_id, prompt_data.agent_id),
                 fetch=False
             )
+            invalidate_agent_cache()
             logger.info(f"Updated agent {prompt_data.agent_id} with active_default_prompt_id {prompt_id}")
         
         logger.info(f"Created prompt for agent {prompt_data.agent_id}, status {prompt_data.status_key}, version {prompt_data.version} with ID {prompt_id}")
@@ -287,6 +289,7 @@ def set_prompt_active(prompt_id: int, is_active: bool = True) -> bool:
                     (prompt_id, prompt.agent_id),
                     fetch=False
                 )
+                invalidate_agent_cache()
                 logger.info(f"Updated agent {prompt.agent_id} with active_default_prompt_id {prompt_id}")
                 
             logger.info(f"Set prompt {prompt_id} as active for agent {prompt.agent_id}, status {prompt.status_key}")
@@ -315,6 +318,7 @@ def set_prompt_active(prompt_id: int, is_active: bool = True) -> bool:
                     (prompt.agent_id, prompt_id),
                     fetch=False
                 )
+                invalidate_agent_cache()
                 logger.info(f"Cleared active_default_prompt_id for agent {prompt.agent_id}")
                 
             logger.info(f"Set prompt {prompt_id} as inactive")
@@ -389,6 +393,7 @@ def delete_prompt(prompt_id: int) -> bool:
                 (prompt.agent_id, prompt_id),
                 fetch=False
             )
+            invalidate_agent_cache()
             logger.info(f"Cleared active_default_prompt_id for agent {prompt.agent_id}")
         
         # Delete the prompt
@@ -11,10 +11,13 @@ pydantic response models defined in `schema.py`.
 from __future__ import annotations
 
 import logging
+import threading
 import time
-from typing import Dict, Any, List, Optional
+from collections import deque
+from typing import Callable, Deque, Dict, Any, List, Optional
 
 import requests
+from fastapi.concurrency import run_in_threadpool
 from pydantic_ai import RunContext
 
 from src.config import settings
@@ -38,6 +41,47 @@ logger = logging.getLogger(__name__)
 API_BASE_URL = "https://api.airtable.com/v0"
 DEFAULT_PAGE_SIZE = 100  # Airtable maximum
 MAX_RECORDS_PER_BATCH = 10  # Airtable maximum for writes
+MAX_REQUESTS_PER_SECOND = 5  # Airtable per-base API rate limit
+
+
+class _RateLimiter:
+    """Thread-safe sliding-window limiter that keeps requests under the API limit.
+
+    Remembers the send times of the last ``rate`` requests and holds a new
+    one until the oldest of them is at least one second old, so no window of
+    one second ever carries more than ``rate`` requests and we never pay
+    Airtable's 30 second 429 penalty.
+    """
+
+    def __init__(
+        self,
+        rate: int,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._sleep = sleep
+        self._clock = clock
+        self._sent: Deque[float] = deque(maxlen=rate)
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = self._clock()
+            send_at = now
+            if len(self._sent) == self._sent.maxlen:
+                send_at = max(now, self._sent[0] + 1.0)
+            # Reserve the slot before sleeping so concurrent callers queue up
+            self._sent.append(send_at)
+        delay = send_at - now
+        if delay > 0:
+            self._sleep(delay)
+
+
+_rate_limiter = _RateLimiter(MAX_REQUESTS_PER_SECOND)
+
+# Shared session so consecutive tool calls reuse the TLS connection to
+# api.airtable.com instead of paying a new handshake per request.
+_session = requests.Session()
 
 
 def _get_token() -> str:
@@ -68,7 +112,8 @@ def _request(
     """Make an HTTP request with basic rate-limit retry logic."""
 
     while True:
-        response = requests.request(method, url, headers=_headers(), params=params, json=json, timeout=30)
+        _rate_limiter.acquire()
+        response = _session.request(method, url, headers=_headers(), params=params, json=json, timeout=30)
         if response.status_code != 429:
             # Normal exit path
             return response
@@ -84,6 +129,11 @@ def _request(
         retry_on_rate_limit = False
 
 
+async def _arequest(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Run :func:`_request` in a worker thread so tools don't block the event loop."""
+    return await run_in_threadpool(_request, method, url, **kwargs)
+
+
 # ---------------------------------------------------------------------------
 # Description helpers (used by interface.py)
 # ---------------------------------------------------------------------------
@@ -176,7 +226,7 @@ async def list_records(
     url = f"{API_BASE_URL}/{base}/{table}"
 
     try:
-        response = _request("GET", url, params=params)
+        response = await _arequest("GET", url, params=params)
         if response.status_code != 200:
             return ListRecordsResponse(success=False, error=f"HTTP {response.status_code}: {response.text}").model_dump()
         data = response.json()
@@ -203,7 +253,7 @@ async def get_record(
 
     url = f"{API_BASE_URL}/{base}/{table}/{record_id}"
     try:
-        response = _request("GET", url)
+        response = await _arequest("GET", url)
         if response.status_code != 200:
             return GetRecordResponse(success=False, error=f"HTTP {response.status_code}: {response.text}").model_dump()
         data = response.json()
@@ -236,7 +286,7 @@ async def create_records(
         "typecast": typecast,
     }
     try:
-        response = _request("POST", url, json=payload)
+        response = await _arequest("POST", url, json=payload)
         if response.status_code != 200 and response.status_code != 201:
             return CreateRecordsResponse(success=False, error=f"HTTP {response.status_code}: {response.text}").model_dump()
         data = response.json()
@@ -274,7 +324,7 @@ async def update_records(
     url = f"{API_BASE_URL}/{base}/{table}"
     payload = {"records": processed, "typecast": typecast}
     try:
-        response = _request("PATCH", url, json=payload)
+        response = await _arequest("PATCH", url, json=payload)
         if response.status_code != 200:
             return UpdateRecordsResponse(success=False, error=f"HTTP {response.status_code}: {response.text}").model_dump()
         data = response.json()
@@ -304,7 +354,7 @@ async def delete_records(
     url = f"{API_BASE_URL}/{base}/{table}"
     try:
         # Pass list of tuples directly to preserve duplicates
-        response = _request("DELETE", url, params=params)
+        response = await _arequest("DELETE", url, params=params)
         if response.status_code != 200:
             return DeleteRecordsResponse(success=False, error=f"HTTP {response.status_code}: {response.text}").model_dump()
         data = response.json()
@@ -319,7 +369,7 @@ async def list_bases(ctx: RunContext[Dict]) -> Dict[str, Any]:
     """List bases the PAT has access to."""
     url = f"{API_BASE_URL}/meta/bases"
     try:
-        response = _request("GET", url)
+        response = await _arequest("GET", url)
         if response.status_code != 200:
             return ListBasesResponse(success=False, error=f"HTTP {response.status_code}: {response.text}").model_dump()
         data = response.json()
@@ -334,7 +384,7 @@ async def list_tables(ctx: RunContext[Dict], base_id: str) -> Dict[str, Any]:
     """List tables inside a base (requires base_id)."""
     url = f"{API_BASE_URL}/meta/bases/{base_id}/tables"
     try:
-        response = _request("GET", url)
+        response = await _arequest("GET", url)
         if response.status_code != 200:
             return ListTablesResponse(success=False, error=f"HTTP {response.status_code}: {response.text}").model_dump()
         data = response.json()
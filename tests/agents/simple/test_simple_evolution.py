@@ -44,6 +44,16 @@ class TestSimpleAgentEvolution:
         from src.agents.common.evolution import EvolutionMessagePayload
         assert EvolutionMessagePayload is not None
     
+    def test_evolution_payload_is_frozen(self, sample_evolution_payload):
+        """Test that parsed payloads are immutable and drop unknown keys."""
+        from pydantic import ValidationError
+
+        payload = EvolutionMessagePayload(**sample_evolution_payload)
+        assert payload.instance == "test-instance"
+        assert not hasattr(payload, "apikey")
+        with pytest.raises(ValidationError):
+            payload.instance = "other-instance"
+    
     def test_simple_agent_initialization(self, simple_agent):
         """Test that Simple agent initializes with Evolution tools."""
         assert simple_agent is not None
@@ -0,0 +1,193 @@
+"""Tests for the agent repository module."""
+import uuid
+
+import pytest
+from unittest.mock import patch
+
+from src.db.repository.agent import (
+    get_agent,
+    get_agent_by_name,
+    list_agents,
+    update_agent,
+    register_agent,
+    link_session_to_agent,
+    invalidate_agent_cache,
+)
+
+# Sample data
+TEST_AGENT_ROW = {
+    "id": 1,
+    "name": "simple",
+    "type": "simple",
+    "model": "openai:gpt-4.1-mini",
+    "description": "Test agent",
+    "version": "1.0.0",
+    "config": {"foo": "bar"},
+    "active": True,
+    "run_id": 1,
+    "active_default_prompt_id": None,
+    "created_at": "2025-05-13T00:00:00Z",
+    "updated_at": "2025-05-13T00:00:00Z",
+}
+
+@pytest.fixture
+def mock_execute_query():
+    invalidate_agent_cache()
+    with patch('src.db.repository.agent.execute_query') as mock:
+        yield mock
+    invalidate_agent_cache()
+
+class TestAgentLookupCache:
+    """Test suite for the in-process agent lookup cache."""
+
+    def test_get_agent_is_cached(self, mock_execute_query):
+        """Repeated lookups by ID hit the database once."""
+        mock_execute_query.return_value = [dict(TEST_AGENT_ROW)]
+
+        first = get_agent(1)
+        second = get_agent(1)
+
+        assert first.name == second.name == "simple"
+        mock_execute_query.assert_called_once()
+
+    def test_lookup_by_id_populates_name_cache(self, mock_execute_query):
+        """A lookup by ID also serves later lookups by name."""
+        mock_execute_query.return_value = [dict(TEST_AGENT_ROW)]
+
+        get_agent(1)
+        agent = get_agent_by_name("simple")
+
+        assert agent.id == 1
+        mock_execute_query.assert_called_once()
+
+    def test_cached_agent_is_a_copy(self, mock_execute_query):
+        """Mutating a returned agent does not leak into the cache."""
+        mock_execute_query.return_value = [dict(TEST_AGENT_ROW)]
+
+        agent = get_agent(1)
+        agent.model = "changed"
+        agent.config["foo"] = "changed"
+
+        cached = get_agent(1)
+        assert cached.model == "openai:gpt-4.1-mini"
+        assert cached.config == {"foo": "bar"}
+
+    def test_missing_agent_is_not_cached(self, mock_execute_query):
+        """Misses always go back to the database."""
+        mock_execute_query.return_value = []
+
+        assert get_agent_by_name("missing") is None
+        assert get_agent_by_name("missing") is None
+        assert mock_execute_query.call_count == 2
+
+    def test_update_invalidates_cache(self, mock_execute_query):
+        """Writing an agent forces the next lookup to hit the database."""
+        mock_execute_query.return_value = [dict(TEST_AGENT_ROW)]
+
+        agent = get_agent(1)
+        agent.model = "openai:gpt-4o"
+        update_agent(agent)
+
+        mock_execute_query.return_value = [dict(TEST_AGENT_ROW, model="openai:gpt-4o")]
+        assert get_agent(1).model == "openai:gpt-4o"
+        assert mock_execute_query.call_count == 3
+
+    def test_read_racing_a_write_is_not_cached(self, mock_execute_query):
+        """A row read before a concurrent invalidation is not stored."""
+        def read_then_concurrent_write(*args, **kwargs):
+            invalidate_agent_cache()
+            return [dict(TEST_AGENT_ROW)]
+
+        mock_execute_query.side_effect = read_then_concurrent_write
+        get_agent(1)
+
+        mock_execute_query.side_effect = None
+        mock_execute_query.return_value = [dict(TEST_AGENT_ROW)]
+        get_agent(1)
+        assert mock_execute_query.call_count == 2
+
+    def test_cache_size_is_bounded(self, mock_execute_query):
+        """The oldest entry is evicted once the cache is full."""
+        with patch('src.db.repository.agent._AGENT_CACHE_MAXSIZE', 2):
+            for agent_id in (1, 2, 3):
+                mock_execute_query.return_value = [dict(TEST_AGENT_ROW, id=agent_id, name=f"agent{agent_id}")]
+                get_agent(agent_id)
+
+            mock_execute_query.return_value = [dict(TEST_AGENT_ROW, id=1, name="agent1")]
+            get_agent(3)
+            assert mock_execute_query.call_count == 3
+            get_agent(1)
+            assert mock_execute_query.call_count == 4
+
+class TestRegisterAgent:
+    """Test suite for register_agent."""
+
+    def test_register_agent_single_upsert(self, mock_execute_query):
+        """A plain name registers with a single UPSERT round-trip."""
+        mock_execute_query.return_value = [{"id": 7, "inserted": True}]
+
+        agent_id = register_agent("simple", "simple", "openai:gpt-4.1-mini", config={"a": 1})
+
+        assert agent_id == 7
+        mock_execute_query.assert_called_once()
+        query, params = mock_execute_query.call_args[0]
+        assert "ON CONFLICT (name) DO UPDATE" in query
+        assert params[0] == "simple"
+        assert params[4] == '{"a": 1}'
+
+    def test_register_agent_blocks_suffix_variation(self, mock_execute_query):
+        """A '<existing>_agent' name returns the existing agent's ID without writing."""
+        mock_execute_query.return_value = [{"id": 3, "name": "simple"}]
+
+        agent_id = register_agent("Simple_Agent", "simple", "openai:gpt-4.1-mini")
+
+        assert agent_id == 3
+        mock_execute_query.assert_called_once()
+        query, params = mock_execute_query.call_args[0]
+        assert query.lstrip().startswith("SELECT")
+        assert "simple" in params[0]
+
+    def test_register_agent_suffix_without_existing_agent(self, mock_execute_query):
+        """A suffixed name with no base agent is registered normally."""
+        mock_execute_query.side_effect = [[], [{"id": 9, "inserted": True}]]
+
+        assert register_agent("flashagent", "simple", "openai:gpt-4.1-mini") == 9
+        assert mock_execute_query.call_count == 2
+
+class TestAgentColumns:
+    """Test that agent lookups select explicit columns."""
+
+    def test_lookups_do_not_select_star(self, mock_execute_query):
+        """Lookups name their columns instead of using SELECT *."""
+        mock_execute_query.return_value = [dict(TEST_AGENT_ROW)]
+
+        get_agent(1)
+        list_agents()
+
+        for call in mock_execute_query.call_args_list:
+            assert "SELECT *" not in call[0][0]
+            assert "active_default_prompt_id" in call[0][0]
+
+class TestLinkSessionToAgent:
+    """Test suite for link_session_to_agent."""
+
+    @patch('src.db.repository.session.get_session')
+    def test_link_updates_in_single_query(self, mock_get_session, mock_execute_query):
+        """Messages and session are updated with one statement after the agent lookup."""
+        mock_get_session.return_value = None
+        mock_execute_query.side_effect = [
+            [dict(TEST_AGENT_ROW)],
+            [{"message_count": 2, "session_count": 1}],
+        ]
+
+        assert link_session_to_agent(uuid.uuid4(), 1) is True
+        assert mock_execute_query.call_count == 2
+        assert "UPDATE messages" in mock_execute_query.call_args[0][0]
+        assert "UPDATE sessions" in mock_execute_query.call_args[0][0]
+
+    def test_link_to_missing_agent_fails(self, mock_execute_query):
+        """Linking to an unknown agent does not touch sessions or messages."""
+        mock_execute_query.return_value = []
+
+        assert link_session_to_agent(uuid.uuid4(), 42) is False
+        mock_execute_query.assert_called_once()
@@ -0,0 +1,15 @@
+"""Pytest configuration for Airtable tool tests."""
+import pytest
+
+from src.tools.airtable import tool
+from src.tools.airtable.tool import _RateLimiter, MAX_REQUESTS_PER_SECOND
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit_sleep(monkeypatch):
+    """Give each test a fresh rate limiter that never really sleeps.
+
+    The module-level limiter binds ``time.sleep`` at definition time and keeps
+    state across tests, so patching ``tool.time.sleep`` does not cover it.
+    """
+    monkeypatch.setattr(tool, "_rate_limiter", _RateLimiter(MAX_REQUESTS_PER_SECOND, sleep=lambda _: None))
@@ -211,7 +211,7 @@ class TestStressTests:
         assert len(result["records"][0]["fields"]["LargeText"]) == 10000
         assert duration < 2.0  # Should handle large data efficiently
     
-    @patch('src.tools.airtable.tool.requests.request')
+    @patch('src.tools.airtable.tool._session.request')
     @pytest.mark.asyncio 
     async def test_rate_limit_simulation(self, mock_request, monkeypatch):
         """Test behavior under simulated rate limiting."""
@@ -8,6 +8,7 @@ from src.tools.airtable.tool import (
     _headers, 
     _get_token, 
     _request,
+    _RateLimiter,
     MAX_RECORDS_PER_BATCH,
     DEFAULT_PAGE_SIZE,
     API_BASE_URL
@@ -47,7 +48,7 @@ class TestTokenManagement:
 class TestRequestHandling:
     """Test HTTP request handling and rate limiting."""
     
-    @patch('src.tools.airtable.tool.requests.request')
+    @patch('src.tools.airtable.tool._session.request')
     def test_request_success(self, mock_request, monkeypatch):
         """_request() should handle successful responses."""
         monkeypatch.setattr(settings, "AIRTABLE_TOKEN", "test_token")
@@ -69,7 +70,7 @@ class TestRequestHandling:
         assert headers['Authorization'] == 'Bearer test_token'
         assert headers['Content-Type'] == 'application/json'
     
-    @patch('src.tools.airtable.tool.requests.request')
+    @patch('src.tools.airtable.tool._session.request')
     @patch('src.tools.airtable.tool.time.sleep')
     def test_request_rate_limit_retry(self, mock_sleep, mock_request, monkeypatch):
         """_request() should handle 429 rate limiting with retry."""
@@ -91,7 +92,7 @@ class TestRequestHandling:
         assert mock_request.call_count == 2
         mock_sleep.assert_called_once_with(30)  # Should sleep 30 seconds
     
-    @patch('src.tools.airtable.tool.requests.request')
+    @patch('src.tools.airtable.tool._session.request')
     def test_request_rate_limit_no_retry(self, mock_request, monkeypatch):
         """_request() should not retry when retry_on_rate_limit=False."""
         monkeypatch.setattr(settings, "AIRTABLE_TOKEN", "test_token")
@@ -105,7 +106,7 @@ class TestRequestHandling:
         assert result.status_code == 429
         assert mock_request.call_count == 1
     
-    @patch('src.tools.airtable.tool.requests.request')
+    @patch('src.tools.airtable.tool._session.request')
     def test_request_with_params_and_json(self, mock_request, monkeypatch):
         """_request() should pass through params and json correctly."""
         monkeypatch.setattr(settings, "AIRTABLE_TOKEN", "test_token")
@@ -134,6 +135,30 @@ class TestRequestHandling:
         )
 
 
+class TestRateLimiter:
+    """Test proactive request pacing."""
+
+    def test_never_exceeds_rate_in_any_second(self):
+        """_RateLimiter should hold the 6th call until the 1st is a second old."""
+        now = [100.0]
+
+        def fake_sleep(delay):
+            now[0] += delay
+
+        limiter = _RateLimiter(5, sleep=fake_sleep, clock=lambda: now[0])
+
+        released = []
+        for _ in range(12):
+            limiter.acquire()
+            released.append(now[0])
+
+        assert released[:5] == [100.0] * 5
+        assert released[5] >= 101.0
+        assert released[10] >= 102.0
+        for i in range(5, len(released)):
+            assert released[i] - released[i - 5] >= 1.0
+
+
 class TestConstants:
     """Test that constants are set correctly."""
     
@@ -169,7 +194,7 @@ class TestValidation:
 class TestErrorHandling:
     """Test error handling scenarios."""
     
-    @patch('src.tools.airtable.tool.requests.request')
+    @patch('src.tools.airtable.tool._session.request')
     def test_request_timeout_handling(self, mock_request, monkeypatch):
         """Test that request timeout is set correctly."""
         monkeypatch.setattr(settings, "AIRTABLE_TOKEN", "test_token")